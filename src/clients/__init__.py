@@ -1 +1,12 @@
 """API clients package."""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional and unavailable on Windows
+    pass
+else:
+    # Event loops created from here on (e.g. by asyncio.run) use uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
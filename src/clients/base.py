@@ -1,10 +1,26 @@
 """Base API client class."""
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import deque
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Optional, Tuple, Type, TypeVar
 
 import httpx
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Default pool size per client. Each client talks to a single origin, so with
+# HTTP/2 one connection multiplexes every request; HTTP/1.1 needs a few.
+MULTIPLEXED_CONNECTION_LIMIT = 1
+HTTP1_CONNECTION_LIMIT = 8
+
+# Status codes worth retrying: throttling and transient gateway errors
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
 
 
 class APIResponse(BaseModel):
@@ -16,30 +32,230 @@ class APIResponse(BaseModel):
     status_code: Optional[int] = None
 
 
+class AIMDLimiter:
+    """Concurrency limiter sized by additive increase, multiplicative decrease.
+
+    The limit grows by roughly one slot per window of successful requests and
+    halves whenever a request is throttled or fails, staying between
+    ``min_limit`` and ``max_limit``.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        """Initialize limiter with its upper and lower concurrency bounds.
+
+        Raises:
+            ValueError: If either bound is below one
+        """
+        if max_limit < 1 or min_limit < 1:
+            raise ValueError(
+                f"Concurrency limits must be at least 1, got max_limit={max_limit}, "
+                f"min_limit={min_limit}"
+            )
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.limit = float(max_limit)
+        self._active = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self._active < int(self.limit) and not self._waiters:
+            self._active += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot and wake waiters that now fit under the limit."""
+        self._active -= 1
+        self._wake_waiters()
+
+    def on_success(self) -> None:
+        """Grow the limit additively after a successful request."""
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake_waiters()
+
+    def on_failure(self) -> None:
+        """Shrink the limit multiplicatively after a throttled or failed request."""
+        self.limit = max(float(self.min_limit), self.limit / 2)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._active < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+
 class BaseAPIClient(ABC):
     """Base class for all API clients."""
 
-    def __init__(self, api_key: str, base_url: str, timeout: float = 30.0):
-        """Initialize API client with key, base URL and timeout."""
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: float = 30.0,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 120.0,
+        http2: bool = True,
+        max_concurrency: int = 100,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 10.0,
+    ):
+        """Initialize API client with key, base URL, timeout, pool and retry settings.
+
+        Pool sizes default to one connection when HTTP/2 is enabled and
+        ``HTTP1_CONNECTION_LIMIT`` otherwise, with every pooled connection
+        kept alive. Idle connections are kept for two minutes so the gaps
+        between an agent's bursts of tool calls do not force reconnects.
+        """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        # Headers are fixed for the client's lifetime, so build them once
+        self._headers = self._get_default_headers()
+        if max_connections is None:
+            max_connections = (
+                MULTIPLEXED_CONNECTION_LIMIT if http2 else HTTP1_CONNECTION_LIMIT
+            )
+        self.max_connections = max_connections
+        self.max_keepalive_connections = (
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else max_connections
+        )
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._limiter = AIMDLimiter(max_limit=max_concurrency)
+        # Pooled connections are bound to the event loop that opened them,
+        # so keep one client per running loop. The loop itself is stored to
+        # guard against id() reuse once a finished loop is collected.
+        self._clients: Dict[
+            int, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]
+        ] = {}
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout, headers=self._get_default_headers()
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(id(loop))
+        client = entry[1] if entry and entry[0] is loop else None
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self._headers,
+                transport=self._create_transport(),
             )
-        return self._client
+            # Drop clients left behind by loops that have since finished.
+            self._clients = {
+                key: value
+                for key, value in self._clients.items()
+                if not value[0].is_closed()
+            }
+            self._clients[id(loop)] = (loop, client)
+        return client
+
+    def _create_transport(self) -> httpx.AsyncBaseTransport:
+        """Create the connection-pooling transport for a new HTTP client."""
+        # Limits and HTTP/2 are configured on the transport, since httpx
+        # ignores them on the client once a transport is supplied.
+        return httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            retries=0,
+        )
 
     @abstractmethod
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for API requests."""
         pass
 
+    def _url(self, endpoint: str) -> str:
+        """Join an endpoint path onto the base URL."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send HTTP request to an absolute API URL and return the raw response.
+
+        Throttled (429) and transient gateway (502/503/504) responses and
+        transport errors are retried up to ``max_retries`` times with jittered
+        exponential backoff, honouring ``Retry-After`` when present. Backoff
+        uses ``asyncio.sleep`` so other coroutines keep running meanwhile.
+        """
+        attempt = 0
+        while True:
+            await self._limiter.acquire()
+            try:
+                response = await self.client.request(
+                    method=method, url=url, params=params, json=json_data
+                )
+            except httpx.RequestError:
+                self._limiter.on_failure()
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self._limiter.on_success()
+                    # Hold the slot while backing off a nearly exhausted quota
+                    quota_delay = self._rate_limit_delay(response)
+                    if quota_delay > 0:
+                        await asyncio.sleep(quota_delay)
+                    return response
+
+                self._limiter.on_failure()
+                if attempt == self.max_retries:
+                    return response
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                delay = (
+                    min(retry_after, self.backoff_cap)
+                    if retry_after is not None
+                    else self._backoff_delay(attempt)
+                )
+            finally:
+                self._limiter.release()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _rate_limit_delay(self, response: httpx.Response) -> float:
+        """Get delay to apply before releasing a slot after a successful response.
+
+        Subclasses can inspect provider rate-limit headers here; the default
+        applies no delay.
+        """
+        return 0.0
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get jittered exponential backoff delay for a retry attempt."""
+        delay = self.backoff_base * (2.0**attempt) + random.uniform(
+            0, self.backoff_base
+        )
+        return min(self.backoff_cap, delay)
+
     async def _make_request(
         self,
         method: str,
@@ -48,14 +264,22 @@ class BaseAPIClient(ABC):
         json_data: Optional[Dict[str, Any]] = None,
     ) -> APIResponse:
         """Make HTTP request to API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        return await self._make_request_url(
+            method, self._url(endpoint), params, json_data
+        )
 
+    async def _make_request_url(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> APIResponse:
+        """Make HTTP request to an absolute API URL, skipping the endpoint join."""
         try:
-            response = await self.client.request(
-                method=method, url=url, params=params, json=json_data
-            )
+            response = await self._send(method, url, params, json_data)
 
-            response_data = response.json() if response.content else {}
+            response_data = orjson.loads(response.content) if response.content else {}
 
             return APIResponse(
                 success=response.is_success,
@@ -75,11 +299,43 @@ class BaseAPIClient(ABC):
                 success=False, error=f"Unexpected error: {str(e)}", status_code=None
             )
 
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+    async def _make_request_typed(
+        self,
+        method: str,
+        url: str,
+        model_cls: Type[ModelT],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[ModelT]:
+        """Make HTTP request to an absolute API URL and validate the body as ``model_cls``.
+
+        The raw response bytes are handed straight to Pydantic's JSON parser,
+        skipping the intermediate dict and ``APIResponse`` wrapper.
+
+        Returns:
+            Parsed model if the request succeeded and validated, None otherwise
+        """
+        try:
+            response = await self._send(method, url, params, json_data)
+        except httpx.RequestError:
+            return None
+
+        if not response.is_success or not response.content:
+            return None
+
+        try:
+            return model_cls.model_validate_json(response.content)
+        except ValidationError:
+            return None
+
+    async def close(self) -> None:
+        """Close all HTTP clients."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(
+            *(client.aclose() for loop, client in entries if not loop.is_closed()),
+            return_exceptions=True,
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -88,3 +344,22 @@ class BaseAPIClient(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,94 @@
+"""In-memory TTL cache for TikTok API results."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+
+class AsyncTTLCache(Generic[V]):
+    """LRU cache with per-entry expiry and single-flight loading."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """Initialize cache with maximum size and entry time-to-live in seconds."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future[Optional[V]]] = {}
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Optional[V]]]
+    ) -> Optional[V]:
+        """Get a cached value, calling ``loader`` on a miss.
+
+        Concurrent misses for the same key share a single in-flight call to
+        ``loader`` and all receive its outcome, including None results and
+        exceptions. None results are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            try:
+                # Shield so a cancelled follower does not cancel the leader
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leader was cancelled; load on our own instead
+
+        future: asyncio.Future[Optional[V]] = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged twice
+            future.exception()
+            raise
+        else:
+            if value is not None:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -1,23 +1,51 @@
 """TikTok API client implementation."""
 
-from typing import Dict, Optional
+import asyncio
+import math
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+import httpx
 
 from ..base import BaseAPIClient
+from ._cache import AsyncTTLCache
 from .endpoints import BASE_URL, ENDPOINTS
 from .models import (
     HashtagInfo,
+    HashtagInfoResponse,
     HashtagPostsResponse,
+    OpaqueCursor,
     PaginatedResult,
-    TikTokAPIResponse,
+    VideoInfo,
 )
 
 
 class TikTokClient(BaseAPIClient):
     """TikTok API client for scraping TikTok data."""
 
-    def __init__(self, api_key: str, timeout: float = 30.0):
-        """Initialize TikTok client with API key and timeout."""
-        super().__init__(api_key=api_key, base_url=BASE_URL, timeout=timeout)
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        max_concurrency: int = 5,
+        rate_limit_threshold: int = 1,
+        cache_maxsize: int = 1024,
+        info_cache_ttl: float = 300.0,
+        posts_cache_ttl: float = 60.0,
+    ):
+        """Initialize TikTok client with API key, request and cache settings."""
+        super().__init__(
+            api_key=api_key,
+            base_url=BASE_URL,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
+        self.rate_limit_threshold = rate_limit_threshold
+        self._info_cache: AsyncTTLCache[HashtagInfo] = AsyncTTLCache(
+            maxsize=cache_maxsize, ttl=info_cache_ttl
+        )
+        self._posts_cache: AsyncTTLCache[PaginatedResult] = AsyncTTLCache(
+            maxsize=cache_maxsize, ttl=posts_cache_ttl
+        )
 
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for TikTok API requests."""
@@ -26,6 +54,18 @@ class TikTokClient(BaseAPIClient):
             "X-RapidAPI-Host": "tiktok-scraper7.p.rapidapi.com",
         }
 
+    def _rate_limit_delay(self, response: httpx.Response) -> float:
+        """Back off when RapidAPI reports the request quota is nearly used up."""
+        remaining = response.headers.get("X-RateLimit-Requests-Remaining")
+        if remaining is None or not remaining.isdigit():
+            return 0.0
+        if int(remaining) >= self.rate_limit_threshold:
+            return 0.0
+
+        reset = response.headers.get("X-RateLimit-Requests-Reset", "")
+        reset_after = float(reset) if reset.isdigit() else self.backoff_base
+        return min(reset_after, self.backoff_cap)
+
     async def get_hashtag_info(self, hashtag_name: str) -> Optional[HashtagInfo]:
         """Get information about a TikTok hashtag.
 
@@ -36,29 +76,26 @@ class TikTokClient(BaseAPIClient):
             HashtagInfo object if successful, None otherwise
         """
         # Clean hashtag name (remove # if present)
-        clean_hashtag = hashtag_name.lstrip("#")
+        clean_hashtag = hashtag_name.strip().lstrip("#")
+
+        # Hashtags are case-insensitive, so "#Cats" and "cats" share an entry
+        return await self._info_cache.get_or_load(
+            clean_hashtag.lower(), lambda: self._fetch_hashtag_info(clean_hashtag)
+        )
 
-        response = await self._make_request(
+    async def _fetch_hashtag_info(self, clean_hashtag: str) -> Optional[HashtagInfo]:
+        """Fetch hashtag information from the API, bypassing the cache."""
+        info_response = await self._make_request_typed(
             method="GET",
-            endpoint=ENDPOINTS["CHALLENGE_INFO"],
+            url=ENDPOINTS["CHALLENGE_INFO"],
+            model_cls=HashtagInfoResponse,
             params={"challenge_name": clean_hashtag},
         )
 
-        if not response.success or not response.data:
+        if not info_response or info_response.code != 0:
             return None
 
-        try:
-            # Parse the TikTok API response
-            tiktok_response = TikTokAPIResponse(**response.data)
-
-            if tiktok_response.code != 0 or not tiktok_response.data:
-                return None
-
-            # Create HashtagInfo from the data
-            return HashtagInfo(**tiktok_response.data)
-
-        except Exception:
-            return None
+        return info_response.data
 
     async def search_hashtags(self, query: str, limit: int = 10) -> Dict[str, any]:
         """Search for hashtags related to a query.
@@ -75,7 +112,11 @@ class TikTokClient(BaseAPIClient):
         hashtag_info = await self.get_hashtag_info(query)
 
         if hashtag_info:
-            return {"query": query, "results": [hashtag_info.dict()], "total_count": 1}
+            return {
+                "query": query,
+                "results": [hashtag_info.model_dump(mode="json")],
+                "total_count": 1,
+            }
         else:
             return {"query": query, "results": [], "total_count": 0}
 
@@ -95,50 +136,155 @@ class TikTokClient(BaseAPIClient):
         # Limit count to max 20 as per API limit
         count = min(count, 20)
 
-        response = await self._make_request(
+        return await self._posts_cache.get_or_load(
+            (challenge_id, count, cursor),
+            lambda: self._fetch_hashtag_posts_page(challenge_id, count, cursor),
+        )
+
+    async def _fetch_hashtag_posts_page(
+        self, challenge_id: str, count: int, cursor: int
+    ) -> Optional[PaginatedResult]:
+        """Fetch a single page of hashtag posts from the API, bypassing the cache."""
+        posts_response = await self._make_request_typed(
             method="GET",
-            endpoint=ENDPOINTS["CHALLENGE_POSTS"],
+            url=ENDPOINTS["CHALLENGE_POSTS"],
+            model_cls=HashtagPostsResponse,
             params={"challenge_id": challenge_id, "count": count, "cursor": cursor},
         )
 
-        if not response.success or not response.data:
+        if not posts_response or posts_response.code != 0 or not posts_response.data:
             return None
 
-        try:
-            # Parse the TikTok API response
-            posts_response = HashtagPostsResponse(**response.data)
+        return PaginatedResult.model_construct(
+            videos=posts_response.data.videos,
+            cursor=posts_response.data.cursor,
+            has_more=posts_response.data.hasMore,
+            total_fetched=len(posts_response.data.videos),
+            next_cursor=OpaqueCursor(
+                challenge_id=challenge_id, offset=posts_response.data.cursor
+            ).encode()
+            if posts_response.data.hasMore
+            else "",
+        )
 
-            if posts_response.code != 0 or not posts_response.data:
-                return None
+    async def get_hashtag_posts_by_token(
+        self, token: str, count: int = 20
+    ) -> Optional[PaginatedResult]:
+        """Get the page of posts/videos that an opaque cursor token points to.
 
-            return PaginatedResult(
-                videos=posts_response.data.videos,
-                cursor=posts_response.data.cursor,
-                has_more=posts_response.data.hasMore,
-                total_fetched=len(posts_response.data.videos),
-            )
+        Args:
+            token: The ``next_cursor`` token from a previous PaginatedResult
+            count: Number of videos to fetch (max 20 per API call)
 
-        except Exception:
+        Returns:
+            PaginatedResult for the next page, None if the token is invalid or
+            the request failed
+        """
+        cursor = OpaqueCursor.decode(token)
+        if not cursor:
             return None
 
+        return await self.get_hashtag_posts_page(
+            challenge_id=cursor.challenge_id, count=count, cursor=cursor.offset
+        )
+
     async def get_hashtag_posts(
-        self, challenge_id: str, target_count: int = 50, max_pages: int = 10
+        self,
+        challenge_id: str,
+        target_count: int = 50,
+        max_pages: int = 10,
+        start_cursor: int = 0,
     ) -> Optional[PaginatedResult]:
         """Get posts/videos from a TikTok hashtag challenge with automatic pagination.
 
+        The first page is fetched on its own. When its cursor behaves as a plain
+        offset, the remaining pages are requested concurrently using predicted
+        cursors; if a predicted page is rejected or ends short of the next
+        prediction, pagination continues sequentially from the last good
+        cursor. Videos are deduplicated by ``aweme_id``. Use
+        ``iter_hashtag_posts`` to process videos as pages arrive instead.
+
         Args:
             challenge_id: The hashtag challenge ID
             target_count: Target number of videos to fetch (will fetch at least this many)
             max_pages: Maximum number of API calls to prevent infinite loops
+            start_cursor: Offset to start from, e.g. a decoded ``next_cursor``
 
         Returns:
             PaginatedResult with all fetched videos, None if failed
         """
-        all_videos = []
-        cursor = 0
-        pages_fetched = 0
+        all_videos: List[VideoInfo] = []
+        seen: Set[str] = set()
+
+        def collect(page_videos: List[VideoInfo]) -> None:
+            for video in page_videos:
+                if len(all_videos) >= target_count:
+                    return
+                if video.aweme_id not in seen:
+                    seen.add(video.aweme_id)
+                    all_videos.append(video)
+
+        first_count = min(20, target_count)  # API max is 20
+        page_result = await self.get_hashtag_posts_page(
+            challenge_id=challenge_id, count=first_count, cursor=start_cursor
+        )
 
-        while len(all_videos) < target_count and pages_fetched < max_pages:
+        if not page_result or not page_result.videos:
+            return None
+
+        collect(page_result.videos)
+        cursor = page_result.cursor
+        has_more = page_result.has_more
+        pages_fetched = 1
+
+        # Predictions go out in windows no wider than the concurrency limit, so
+        # a feed that ends early wastes at most one window of requests
+        window = self._limiter.max_limit
+        predicting = cursor == start_cursor + len(page_result.videos)
+        while (
+            predicting
+            and has_more
+            and len(all_videos) < target_count
+            and pages_fetched < max_pages
+        ):
+            remaining = target_count - len(all_videos)
+            batch = min(window, math.ceil(remaining / 20), max_pages - pages_fetched)
+            if batch < 2:
+                break  # A single page gains nothing over the sequential loop
+
+            # Predicted pages follow the last cursor in steps of 20
+            offsets = [cursor + 20 * i for i in range(batch)]
+            pages = await asyncio.gather(
+                *(
+                    self.get_hashtag_posts_page(
+                        challenge_id=challenge_id,
+                        count=min(20, remaining - 20 * i),
+                        cursor=offset,
+                    )
+                    for i, offset in enumerate(offsets)
+                )
+            )
+
+            for i, page in enumerate(pages):
+                # A rejected prediction hands over to the sequential loop below
+                if not page:
+                    predicting = False
+                    break
+
+                collect(page.videos)
+                cursor = page.cursor
+                has_more = page.has_more and bool(page.videos)
+                pages_fetched += 1
+
+                if not has_more or len(all_videos) >= target_count:
+                    break
+                # A short page means the next prediction skipped videos, so
+                # resume sequentially from the cursor the API returned
+                if i + 1 < len(offsets) and cursor != offsets[i + 1]:
+                    predicting = False
+                    break
+
+        while has_more and len(all_videos) < target_count and pages_fetched < max_pages:
             # Calculate how many videos we still need
             remaining = target_count - len(all_videos)
             page_size = min(20, remaining)  # API max is 20
@@ -150,20 +296,60 @@ class TikTokClient(BaseAPIClient):
             if not page_result or not page_result.videos:
                 break
 
-            all_videos.extend(page_result.videos)
+            collect(page_result.videos)
             cursor = page_result.cursor
+            has_more = page_result.has_more
             pages_fetched += 1
 
-            # If no more data available, break
-            if not page_result.has_more:
-                break
-
-        if not all_videos:
-            return None
-
-        return PaginatedResult(
+        return PaginatedResult.model_construct(
             videos=all_videos,
             cursor=cursor,
-            has_more=pages_fetched < max_pages and len(all_videos) >= target_count,
+            has_more=has_more,
             total_fetched=len(all_videos),
+            next_cursor=OpaqueCursor(challenge_id=challenge_id, offset=cursor).encode()
+            if has_more
+            else "",
         )
+
+    async def iter_hashtag_posts(
+        self,
+        challenge_id: str,
+        page_size: int = 20,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[VideoInfo]:
+        """Iterate over posts/videos from a TikTok hashtag challenge page by page.
+
+        Pages are fetched lazily as the consumer advances, so callers can start
+        on the first page right away and stop early without paying for later
+        pages. Videos are deduplicated by ``aweme_id``.
+
+        Args:
+            challenge_id: The hashtag challenge ID
+            page_size: Number of videos to request per API call (max 20)
+            max_pages: Maximum number of API calls, unbounded if None
+
+        Yields:
+            VideoInfo objects in feed order
+        """
+        seen: Set[str] = set()
+        cursor = 0
+        pages_fetched = 0
+
+        while max_pages is None or pages_fetched < max_pages:
+            page_result = await self.get_hashtag_posts_page(
+                challenge_id=challenge_id, count=page_size, cursor=cursor
+            )
+            pages_fetched += 1
+
+            if not page_result or not page_result.videos:
+                return
+
+            for video in page_result.videos:
+                if video.aweme_id not in seen:
+                    seen.add(video.aweme_id)
+                    yield video
+
+            # Stop when exhausted or when the cursor fails to advance
+            if not page_result.has_more or page_result.cursor == cursor:
+                return
+            cursor = page_result.cursor
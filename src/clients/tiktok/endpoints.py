@@ -3,8 +3,8 @@
 # Base URL for TikTok Scraper API
 BASE_URL = "https://tiktok-scraper7.p.rapidapi.com"
 
-# API Endpoints
+# API Endpoints, precomputed as absolute URLs
 ENDPOINTS = {
-    "CHALLENGE_INFO": "/challenge/info",
-    "CHALLENGE_POSTS": "/challenge/posts",
+    "CHALLENGE_INFO": f"{BASE_URL}/challenge/info",
+    "CHALLENGE_POSTS": f"{BASE_URL}/challenge/posts",
 }
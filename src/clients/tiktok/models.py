@@ -1,11 +1,39 @@
 """Pydantic models for TikTok API responses."""
 
+import base64
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from .utils import format_count, format_tiktok_url
 
+# Bump to invalidate previously issued cursors when their meaning changes
+CURSOR_EPOCH = 1
+
+
+class OpaqueCursor(BaseModel):
+    """Stateless pagination cursor handed to callers as an opaque token."""
+
+    challenge_id: str
+    offset: int
+    epoch: int = CURSOR_EPOCH
+
+    def encode(self) -> str:
+        """Encode cursor as a URL-safe token."""
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Optional["OpaqueCursor"]:
+        """Decode a token, returning None if it is malformed or from another epoch."""
+        try:
+            cursor = cls.model_validate_json(base64.urlsafe_b64decode(token))
+        except ValueError:
+            return None
+
+        if cursor.epoch != CURSOR_EPOCH:
+            return None
+        return cursor
+
 
 class PaginatedResult(BaseModel):
     """Result with pagination info."""
@@ -14,6 +42,7 @@ class PaginatedResult(BaseModel):
     cursor: int = 0
     has_more: bool = False
     total_fetched: int = 0
+    next_cursor: str = ""
 
 
 class TikTokAPIResponse(BaseModel):
@@ -28,6 +57,8 @@ class TikTokAPIResponse(BaseModel):
 class HashtagInfo(BaseModel):
     """TikTok hashtag information model."""
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
     id: str
     cha_name: str = Field(alias="cha_name")
     desc: str = ""
@@ -40,11 +71,6 @@ class HashtagInfo(BaseModel):
     type: int = 0
     cover: str = ""
 
-    class Config:
-        """Pydantic configuration."""
-
-        populate_by_name = True
-
     @property
     def hashtag_name(self) -> str:
         """Get clean hashtag name."""
@@ -120,25 +146,37 @@ class VideoInfo(BaseModel):
     author: Optional[VideoAuthor] = None
     is_top: int = 0
 
+    # Formatted counts, computed once since they are read repeatedly
+    _formatted: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute formatted engagement counts."""
+        self._formatted = {
+            "play": format_count(self.play_count, "plays"),
+            "digg": format_count(self.digg_count, "likes"),
+            "comment": format_count(self.comment_count, "comments"),
+            "share": format_count(self.share_count, "shares"),
+        }
+
     @property
     def formatted_play_count(self) -> str:
         """Get formatted play count."""
-        return format_count(self.play_count, "plays")
+        return self._formatted["play"]
 
     @property
     def formatted_digg_count(self) -> str:
         """Get formatted like count."""
-        return format_count(self.digg_count, "likes")
+        return self._formatted["digg"]
 
     @property
     def formatted_comment_count(self) -> str:
         """Get formatted comment count."""
-        return format_count(self.comment_count, "comments")
+        return self._formatted["comment"]
 
     @property
     def formatted_share_count(self) -> str:
         """Get formatted share count."""
-        return format_count(self.share_count, "shares")
+        return self._formatted["share"]
 
     @property
     def tiktok_url(self) -> str:
@@ -151,15 +189,12 @@ class VideoInfo(BaseModel):
 class HashtagPostsData(BaseModel):
     """TikTok hashtag posts data model."""
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
     videos: List[VideoInfo] = []
     cursor: int = 0
     hasMore: bool = False
 
-    class Config:
-        """Pydantic configuration."""
-
-        populate_by_name = True
-
 
 class HashtagPostsResponse(BaseModel):
     """TikTok hashtag posts response model."""
@@ -168,3 +203,12 @@ class HashtagPostsResponse(BaseModel):
     msg: str
     processed_time: float
     data: Optional[HashtagPostsData] = None
+
+
+class HashtagInfoResponse(BaseModel):
+    """TikTok hashtag information response model."""
+
+    code: int
+    msg: str
+    processed_time: float
+    data: Optional[HashtagInfo] = None
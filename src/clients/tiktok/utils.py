@@ -1,6 +1,12 @@
 """Utility functions for TikTok data formatting."""
 
+from functools import lru_cache
 
+# Unit thresholds, largest first
+_UNITS = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+
+@lru_cache(maxsize=4096)
 def format_count(count: int, suffix: str = "") -> str:
     """Format a number with appropriate units (K, M, B).
 
@@ -11,12 +17,10 @@ def format_count(count: int, suffix: str = "") -> str:
     Returns:
         Formatted string with units
     """
-    if count >= 1_000_000_000:
-        formatted = f"{count / 1_000_000_000:.1f}B"
-    elif count >= 1_000_000:
-        formatted = f"{count / 1_000_000:.1f}M"
-    elif count >= 1_000:
-        formatted = f"{count / 1_000:.1f}K"
+    for threshold, unit in _UNITS:
+        if count >= threshold:
+            formatted = f"{count / threshold:.1f}{unit}"
+            break
     else:
         formatted = str(count)
 
@@ -1,9 +1,16 @@
 """Core task management functionality."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .models import Task, TaskPriority, TaskStatus
 
+# Position of each status in the single-pass counter
+_STATUS_INDEX = {
+    TaskStatus.PENDING: 0,
+    TaskStatus.IN_PROGRESS: 1,
+    TaskStatus.COMPLETED: 2,
+}
+
 
 class TaskManager:
     """Core task management operations for agent state."""
@@ -23,6 +30,65 @@ class TaskManager:
 
         return task_objects
 
+    @staticmethod
+    def render_tasks(tasks: List[Task]) -> List[Dict[str, Any]]:
+        """Serialize tasks into JSON-ready dictionaries.
+
+        Args:
+            tasks: Tasks to serialize
+
+        Returns:
+            List of task dictionaries with formatted timestamps
+        """
+        return [TaskManager._render_task(task) for task in tasks]
+
+    @staticmethod
+    def _render_task(task: Task) -> Dict[str, Any]:
+        """Serialize a single task."""
+        return {
+            "id": task.id,
+            "content": task.content,
+            "status": task.status.value,
+            "priority": task.priority.value,
+            "created_at": task.formatted_created_at,
+            "updated_at": task.formatted_updated_at,
+        }
+
+    @staticmethod
+    def _count_statuses(tasks: List[Task]) -> Dict[str, Any]:
+        """Count task statuses in a single pass."""
+        counts = [0, 0, 0]
+        for task in tasks:
+            counts[_STATUS_INDEX[task.status]] += 1
+        return TaskManager._build_summary(counts, len(tasks))
+
+    @staticmethod
+    def _summarize(
+        tasks: List[Task],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Serialize tasks and count their statuses in a single pass."""
+        counts = [0, 0, 0]
+        serialized_tasks = []
+        for task in tasks:
+            counts[_STATUS_INDEX[task.status]] += 1
+            serialized_tasks.append(TaskManager._render_task(task))
+        return serialized_tasks, TaskManager._build_summary(counts, len(tasks))
+
+    @staticmethod
+    def _build_summary(counts: List[int], total_count: int) -> Dict[str, Any]:
+        """Build the summary dictionary from pending/in-progress/completed counts."""
+        pending_count, in_progress_count, completed_count = counts
+        completion_percentage = (
+            (completed_count / total_count * 100) if total_count > 0 else 0
+        )
+
+        return {
+            "pending": pending_count,
+            "in_progress": in_progress_count,
+            "completed": completed_count,
+            "completion_percentage": completion_percentage,
+        }
+
     @staticmethod
     def update_tasks_in_state(
         state: Dict[str, Any], task_data: List[Dict[str, Any]]
@@ -34,51 +100,50 @@ class TaskManager:
             task_data: List of task dictionaries to set as current tasks
 
         Returns:
-            Dictionary with success status and updated tasks info
+            Dictionary with success status, change stats, task IDs and summary
+            counts. Use ``render_tasks`` to serialize the tasks themselves.
         """
         try:
-            # Get existing tasks from state
-            existing_tasks = TaskManager.get_tasks_from_state(state)
-            existing_ids = {task.id for task in existing_tasks}
+            # Index existing tasks from state by ID
+            existing_by_id: Dict[str, Task] = {
+                task.id: task for task in TaskManager.get_tasks_from_state(state)
+            }
 
             # Process new task data
             updated_tasks = []
             stats = {"added": 0, "updated": 0, "unchanged": 0}
 
             for data in task_data:
-                # Parse status and priority
-                status = TaskStatus(data.get("status", "pending"))
-                priority = TaskPriority(data.get("priority", "medium"))
-
-                if "id" in data and data["id"] in existing_ids:
-                    # Find and update existing task
-                    existing_task = None
-                    for task in existing_tasks:
-                        if task.id == data["id"]:
-                            existing_task = task
-                            break
-
-                    if existing_task:
-                        old_data = (
-                            existing_task.content,
-                            existing_task.status,
-                            existing_task.priority,
-                        )
-                        existing_task.update_content(data["content"])
-                        existing_task.status = status
-                        existing_task.priority = priority
-
-                        new_data = (
-                            existing_task.content,
-                            existing_task.status,
-                            existing_task.priority,
-                        )
-                        if old_data != new_data:
-                            stats["updated"] += 1
-                        else:
-                            stats["unchanged"] += 1
-
-                        updated_tasks.append(existing_task)
+                # Parse status and priority (already-parsed enums pass through)
+                status = data.get("status", TaskStatus.PENDING)
+                if not isinstance(status, TaskStatus):
+                    status = TaskStatus(status)
+                priority = data.get("priority", TaskPriority.MEDIUM)
+                if not isinstance(priority, TaskPriority):
+                    priority = TaskPriority(priority)
+
+                existing_task = existing_by_id.get(data.get("id", ""))
+                if existing_task:
+                    old_data = (
+                        existing_task.content,
+                        existing_task.status,
+                        existing_task.priority,
+                    )
+                    existing_task.update_content(data["content"])
+                    existing_task.status = status
+                    existing_task.priority = priority
+
+                    new_data = (
+                        existing_task.content,
+                        existing_task.status,
+                        existing_task.priority,
+                    )
+                    if old_data != new_data:
+                        stats["updated"] += 1
+                    else:
+                        stats["unchanged"] += 1
+
+                    updated_tasks.append(existing_task)
                 else:
                     # Create new task
                     new_task = Task(
@@ -93,36 +158,13 @@ class TaskManager:
             # Update state with new tasks
             state["tasks"] = updated_tasks
 
-            # Calculate summary
-            pending_count = len([t for t in updated_tasks if t.is_pending])
-            in_progress_count = len([t for t in updated_tasks if t.is_in_progress])
-            completed_count = len([t for t in updated_tasks if t.is_completed])
-            total_count = len(updated_tasks)
-            completion_percentage = (
-                (completed_count / total_count * 100) if total_count > 0 else 0
-            )
-
+            # Full task dicts are left to render_tasks for callers that need them
             return {
                 "success": True,
-                "total_tasks": total_count,
+                "total_tasks": len(updated_tasks),
                 "stats": stats,
-                "tasks": [
-                    {
-                        "id": task.id,
-                        "content": task.content,
-                        "status": task.status.value,
-                        "priority": task.priority.value,
-                        "created_at": task.formatted_created_at,
-                        "updated_at": task.formatted_updated_at,
-                    }
-                    for task in updated_tasks
-                ],
-                "summary": {
-                    "pending": pending_count,
-                    "in_progress": in_progress_count,
-                    "completed": completed_count,
-                    "completion_percentage": completion_percentage,
-                },
+                "task_ids": [task.id for task in updated_tasks],
+                "summary": TaskManager._count_statuses(updated_tasks),
             }
 
         except Exception as e:
@@ -155,42 +197,21 @@ class TaskManager:
                     },
                 }
 
-            # Calculate summary
-            pending_count = len([t for t in tasks if t.is_pending])
-            in_progress_count = len([t for t in tasks if t.is_in_progress])
-            completed_count = len([t for t in tasks if t.is_completed])
-            total_count = len(tasks)
-            completion_percentage = (
-                (completed_count / total_count * 100) if total_count > 0 else 0
-            )
+            serialized_tasks, summary = TaskManager._summarize(tasks)
 
             message = (
-                f"Found {total_count} tasks: "
-                f"{pending_count} pending, {in_progress_count} in progress, "
-                f"{completed_count} completed ({completion_percentage:.1f}% complete)"
+                f"Found {len(tasks)} tasks: "
+                f"{summary['pending']} pending, {summary['in_progress']} in progress, "
+                f"{summary['completed']} completed "
+                f"({summary['completion_percentage']:.1f}% complete)"
             )
 
             return {
                 "success": True,
-                "total_tasks": total_count,
+                "total_tasks": len(tasks),
                 "message": message,
-                "tasks": [
-                    {
-                        "id": task.id,
-                        "content": task.content,
-                        "status": task.status.value,
-                        "priority": task.priority.value,
-                        "created_at": task.formatted_created_at,
-                        "updated_at": task.formatted_updated_at,
-                    }
-                    for task in tasks
-                ],
-                "summary": {
-                    "pending": pending_count,
-                    "in_progress": in_progress_count,
-                    "completed": completed_count,
-                    "completion_percentage": completion_percentage,
-                },
+                "tasks": serialized_tasks,
+                "summary": summary,
             }
 
         except Exception as e:
@@ -1,10 +1,16 @@
-"""Pydantic models for task management."""
+"""Data models for task management."""
 
 import time
+from dataclasses import dataclass, field
 from enum import Enum
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp in local time."""
+    return time.strftime(_FMT, time.localtime(timestamp))
 
 
 class TaskStatus(str, Enum):
@@ -23,50 +29,69 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
-class Task(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Task:
     """Individual task model for tracking work items."""
 
-    id: str = Field(default_factory=lambda: str(uuid4())[:8])
+    id: str = field(default_factory=lambda: str(uuid4())[:8])
     content: str
     status: TaskStatus = TaskStatus.PENDING
     priority: TaskPriority = TaskPriority.MEDIUM
-    created_at: float = Field(default_factory=time.time)
-    updated_at: float = Field(default_factory=time.time)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    # Cached display strings, always recomputed from the timestamps. They are
+    # init fields so checkpoint serializers can round-trip all fields as kwargs.
+    _formatted_created_at: str = field(default="", repr=False, compare=False)
+    _formatted_updated_at: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Coerce status and priority given as plain strings and format timestamps."""
+        if not isinstance(self.status, TaskStatus):
+            self.status = TaskStatus(self.status)
+        if not isinstance(self.priority, TaskPriority):
+            self.priority = TaskPriority(self.priority)
+        self._formatted_created_at = _format_timestamp(self.created_at)
+        self._formatted_updated_at = _format_timestamp(self.updated_at)
+
+    def _touch(self) -> None:
+        """Record a modification time."""
+        self.updated_at = time.time()
+        self._formatted_updated_at = _format_timestamp(self.updated_at)
 
     def mark_completed(self) -> None:
         """Mark task as completed."""
         self.status = TaskStatus.COMPLETED
-        self.updated_at = time.time()
+        self._touch()
 
     def mark_in_progress(self) -> None:
         """Mark task as in progress."""
         self.status = TaskStatus.IN_PROGRESS
-        self.updated_at = time.time()
+        self._touch()
 
     def mark_pending(self) -> None:
         """Mark task as pending."""
         self.status = TaskStatus.PENDING
-        self.updated_at = time.time()
+        self._touch()
 
     def update_content(self, content: str) -> None:
         """Update task content."""
         self.content = content
-        self.updated_at = time.time()
+        self._touch()
 
     def update_priority(self, priority: TaskPriority) -> None:
         """Update task priority."""
         self.priority = priority
-        self.updated_at = time.time()
+        self._touch()
 
     @property
     def formatted_created_at(self) -> str:
         """Get formatted creation time."""
-        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created_at))
+        return self._formatted_created_at
 
     @property
     def formatted_updated_at(self) -> str:
         """Get formatted update time."""
-        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.updated_at))
+        return self._formatted_updated_at
 
     @property
     def is_completed(self) -> bool:
@@ -25,6 +25,7 @@ Always use task_manager when:
 - task_manager: Comprehensive task list management (call with no tasks to view current list)
 - tavily_search: General web search for current information
 - tiktok_hashtag_search: Research TikTok hashtag analytics
+- tiktok_hashtags_batch: Research analytics for several TikTok hashtags at once
 - tiktok_hashtag_posts: Fetch TikTok videos from hashtag challenges
 
 System time: {system_time}"""
@@ -14,12 +14,17 @@ from typing import Any, Callable, List
 
 from .task_tools import task_manager
 from .tavily_tools import tavily_search
-from .tiktok_tools import tiktok_hashtag_posts, tiktok_hashtag_search
+from .tiktok_tools import (
+    tiktok_hashtag_posts,
+    tiktok_hashtag_search,
+    tiktok_hashtags_batch,
+)
 from .video_analyzer_tools import video_analyzer
 
 TOOLS: List[Callable[..., Any]] = [
     tavily_search,
     tiktok_hashtag_search,
+    tiktok_hashtags_batch,
     tiktok_hashtag_posts,
     task_manager,
     video_analyzer,
@@ -27,6 +32,7 @@ TOOLS: List[Callable[..., Any]] = [
 
 __all__ = [
     "tiktok_hashtag_search",
+    "tiktok_hashtags_batch",
     "tiktok_hashtag_posts",
     "tavily_search",
     "task_manager",
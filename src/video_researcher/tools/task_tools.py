@@ -4,6 +4,9 @@ from typing import Any, Dict, List, Optional
 
 from common.task_management import TaskManager
 
+_VALID_STATUS = frozenset(("pending", "in_progress", "completed"))
+_VALID_PRIORITY = frozenset(("low", "medium", "high"))
+
 
 def task_manager(
     state: Dict[str, Any], tasks: Optional[List[Dict[str, Any]]] = None
@@ -46,30 +49,34 @@ def task_manager(
             "error": "tasks parameter must be a list of task items",
         }
 
-    # Validate task items
+    # Validate task items; internal code holding TaskManager-built tasks
+    # should call TaskManager.update_tasks_in_state directly instead
     for i, task in enumerate(tasks):
         if not isinstance(task, dict):
             return {"success": False, "error": f"Task item {i} must be a dictionary"}
 
-        if not task.get("content"):
+        get = task.get
+        if not get("content"):
             return {
                 "success": False,
                 "error": f"Task item {i} missing required 'content' field",
             }
 
-        # Validate status if provided
-        if "status" in task and task["status"] not in [
-            "pending",
-            "in_progress",
-            "completed",
-        ]:
+        # Validate status and priority if provided; non-strings are invalid and
+        # may be unhashable, so they must not reach the set lookup
+        status = get("status")
+        if "status" in task and not (
+            isinstance(status, str) and status in _VALID_STATUS
+        ):
             return {
                 "success": False,
                 "error": f"Task item {i} has invalid status. Must be: pending, in_progress, or completed",
             }
 
-        # Validate priority if provided
-        if "priority" in task and task["priority"] not in ["low", "medium", "high"]:
+        priority = get("priority")
+        if "priority" in task and not (
+            isinstance(priority, str) and priority in _VALID_PRIORITY
+        ):
             return {
                 "success": False,
                 "error": f"Task item {i} has invalid priority. Must be: low, medium, or high",
@@ -82,20 +89,28 @@ def task_manager(
         # Add helpful message
         stats = result["stats"]
         summary = result["summary"]
+        added, updated, unchanged = stats["added"], stats["updated"], stats["unchanged"]
+        pending, in_progress, completed, percentage = (
+            summary["pending"],
+            summary["in_progress"],
+            summary["completed"],
+            summary["completion_percentage"],
+        )
 
         message_parts = []
-        if stats["added"] > 0:
-            message_parts.append(f"Added {stats['added']} new tasks")
-        if stats["updated"] > 0:
-            message_parts.append(f"Updated {stats['updated']} tasks")
-        if stats["unchanged"] > 0:
-            message_parts.append(f"{stats['unchanged']} tasks unchanged")
-
-        status_summary = f"Status: {summary['pending']} pending, {summary['in_progress']} in progress, {summary['completed']} completed"
-        completion = f"({summary['completion_percentage']:.1f}% complete)"
-
-        result["message"] = (
-            f"Task list updated successfully. {', '.join(message_parts)}. {status_summary} {completion}"
+        if added > 0:
+            message_parts.append(f"Added {added} new tasks")
+        if updated > 0:
+            message_parts.append(f"Updated {updated} tasks")
+        if unchanged > 0:
+            message_parts.append(f"{unchanged} tasks unchanged")
+
+        result["message"] = " ".join(
+            (
+                f"Task list updated successfully. {', '.join(message_parts)}.",
+                f"Status: {pending} pending, {in_progress} in progress, {completed} completed",
+                f"({percentage:.1f}% complete)",
+            )
         )
 
     return result
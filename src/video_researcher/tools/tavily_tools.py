@@ -1,5 +1,6 @@
 """Tavily search tools for web scraping and search functionality."""
 
+from functools import lru_cache
 from typing import Any, Optional, cast
 
 from langchain_tavily import TavilySearch  # type: ignore[import-not-found]
@@ -7,6 +8,12 @@ from langchain_tavily import TavilySearch  # type: ignore[import-not-found]
 from video_researcher.configuration import Configuration
 
 
+@lru_cache(maxsize=8)
+def _get_tavily(max_results: int) -> TavilySearch:
+    """Get a shared TavilySearch tool so its HTTP session is reused."""
+    return TavilySearch(max_results=max_results)
+
+
 async def tavily_search(query: str) -> Optional[dict[str, Any]]:
     """Search for general web results.
 
@@ -18,5 +25,5 @@ async def tavily_search(query: str) -> Optional[dict[str, Any]]:
         query: The search query string
     """
     configuration = Configuration.from_context()
-    wrapped = TavilySearch(max_results=configuration.max_search_results)
+    wrapped = _get_tavily(configuration.max_search_results)
     return cast(dict[str, Any], await wrapped.ainvoke({"query": query}))
@@ -1,12 +1,196 @@
 """TikTok search and analysis tools."""
 
+import asyncio
 import os
-from typing import Any, Dict
+import warnings
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
-from clients.tiktok import TikTokClient
+import orjson
 
+from clients.tiktok import HashtagInfo, TikTokClient
+from clients.tiktok.models import OpaqueCursor, VideoInfo
 
-async def tiktok_hashtag_search(hashtag: str) -> Dict[str, Any]:
+# Read once at import; the LangGraph server loads .env before importing tools
+_API_KEY = os.getenv("RAPIDAPI_KEY")
+_MISSING_KEY_ERROR = {
+    "error": "RAPIDAPI_KEY environment variable not set",
+    "success": False,
+}
+
+N = TypeVar("N", int, float)
+
+
+def _number_from_env(name: str, default: N, parse: Callable[[str], N]) -> N:
+    """Read a positive numeric setting, warning and using ``default`` if invalid."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = parse(value)
+    except ValueError:
+        number = None
+    # Written as "not > 0" so NaN is rejected too
+    if number is None or not number > 0:
+        warnings.warn(
+            f"{name} must be a positive number, got {value!r}; using {default}",
+            stacklevel=2,
+        )
+        return default
+    return number
+
+
+# Seconds that hashtag info stays cached; posts use the client's shorter default
+HASHTAG_TTL = _number_from_env("TIKTOK_HASHTAG_TTL", 600.0, float)
+
+# Upper bound on in-flight RapidAPI requests across all tool calls
+RAPIDAPI_CONCURRENCY = _number_from_env("RAPIDAPI_CONCURRENCY", 5, int)
+
+# Return successful results as pre-encoded JSON instead of dicts
+RAW_JSON = os.getenv("AGENT_RAW_JSON") == "1"
+
+# Shared across tool calls so connections and cached results are reused; the
+# client keeps a separate HTTP connection pool per event loop
+_client: Optional[TikTokClient] = None
+
+
+def _get_client(api_key: str) -> TikTokClient:
+    """Get the shared TikTok client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = TikTokClient(
+            api_key=api_key,
+            max_concurrency=RAPIDAPI_CONCURRENCY,
+            info_cache_ttl=HASHTAG_TTL,
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared TikTok client, e.g. on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+class RawJson(str):
+    """A tool result that is already encoded as JSON.
+
+    Tool results that are strings are passed to the model verbatim, skipping
+    the framework's stdlib ``json`` serialization. A ``str`` subclass is used
+    rather than bytes, which the framework would encode again.
+    """
+
+
+def _fast_dumps(obj: Any) -> RawJson:
+    """Serialize a tool payload to JSON with orjson."""
+    return RawJson(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode())
+
+
+def _respond(payload: Dict[str, Any]) -> Union[Dict[str, Any], RawJson]:
+    """Return a successful payload, pre-encoded when AGENT_RAW_JSON=1."""
+    return _fast_dumps(payload) if RAW_JSON else payload
+
+
+def _format_hashtag_info(
+    info: HashtagInfo, include_raw: bool = False, compact: bool = False
+) -> Dict[str, Any]:
+    """Format hashtag info for the agent, optionally with the raw API fields.
+
+    Compact results drop the formatted counts and the raw API fields.
+    """
+    formatted = {
+        "success": True,
+        "hashtag": info.hashtag_name,
+        "challenge_id": info.id,
+        "description": info.desc or "No description available",
+        "stats": {"user_count": info.user_count, "view_count": info.view_count}
+        if compact
+        else {
+            "user_count": info.user_count,
+            "formatted_user_count": info.formatted_user_count,
+            "view_count": info.view_count,
+            "formatted_view_count": info.formatted_view_count,
+        },
+        "characteristics": {
+            "is_challenge": info.is_challenge,
+            "is_commerce": info.is_commerce,
+            "is_pgcshow": info.is_pgcshow,
+            "is_strong_music": info.is_strong_music,
+            "type": info.type,
+        },
+        "cover": info.cover,
+    }
+    if include_raw and not compact:
+        formatted["raw_data"] = info.model_dump(mode="json", exclude_unset=True)
+    return formatted
+
+
+def _format_video(video: VideoInfo, compact: bool = False) -> Dict[str, Any]:
+    """Format a video for the agent.
+
+    Compact results keep only identifying fields and raw engagement counts.
+    """
+    if compact:
+        return {
+            "video_id": video.video_id,
+            "title": video.title,
+            "tiktok_url": video.tiktok_url,
+            "duration": video.duration,
+            "stats": {
+                "play_count": video.play_count,
+                "like_count": video.digg_count,
+                "comment_count": video.comment_count,
+            },
+            "create_time": video.create_time,
+        }
+
+    author = video.author
+    music = video.music_info
+    formatted = {
+        "video_id": video.video_id,
+        "title": video.title,
+        "tiktok_url": video.tiktok_url,
+        "play_url": video.play,
+        "cover_url": video.cover,
+        "duration": video.duration,
+        "author": {
+            "username": author.unique_id,
+            "nickname": author.nickname,
+            "avatar": author.avatar,
+        }
+        if author
+        else {"username": "unknown", "nickname": "unknown", "avatar": ""},
+        "stats": {
+            "play_count": video.play_count,
+            "formatted_play_count": video.formatted_play_count,
+            "like_count": video.digg_count,
+            "formatted_like_count": video.formatted_digg_count,
+            "comment_count": video.comment_count,
+            "formatted_comment_count": video.formatted_comment_count,
+            "share_count": video.share_count,
+            "formatted_share_count": video.formatted_share_count,
+            "collect_count": video.collect_count,
+        },
+        "music": {
+            "title": music.title,
+            "author": music.author,
+            "duration": music.duration,
+            "original": music.original,
+        }
+        if music
+        else {"title": "", "author": "", "duration": 0, "original": False},
+        "create_time": video.create_time,
+    }
+    # Only pinned videos are flagged; a false flag on every video is noise
+    if video.is_top:
+        formatted["is_top"] = True
+    return formatted
+
+
+async def tiktok_hashtag_search(
+    hashtag: str, include_raw: bool = False, compact: bool = False
+) -> Union[Dict[str, Any], RawJson]:
     """Search for TikTok hashtag information.
 
     This tool retrieves detailed information about a TikTok hashtag including:
@@ -17,44 +201,25 @@ async def tiktok_hashtag_search(hashtag: str) -> Dict[str, Any]:
 
     Args:
         hashtag: The hashtag name to search for (with or without #)
+        include_raw: Also return the raw API fields (default False)
+        compact: Omit formatted counts and raw fields to save tokens (default False)
     """
-    api_key = os.getenv("RAPIDAPI_KEY")
-    if not api_key:
-        return {"error": "RAPIDAPI_KEY environment variable not set", "success": False}
+    if not _API_KEY:
+        return dict(_MISSING_KEY_ERROR)
 
     try:
-        async with TikTokClient(api_key=api_key) as client:
-            hashtag_info = await client.get_hashtag_info(hashtag)
-
-            if not hashtag_info:
-                return {
-                    "error": f"Hashtag '{hashtag}' not found or API request failed",
-                    "success": False,
-                    "hashtag": hashtag,
-                }
+        client = _get_client(_API_KEY)
+        hashtag_info = await client.get_hashtag_info(hashtag)
 
+        if not hashtag_info:
             return {
-                "success": True,
-                "hashtag": hashtag_info.hashtag_name,
-                "challenge_id": hashtag_info.id,
-                "description": hashtag_info.desc or "No description available",
-                "stats": {
-                    "user_count": hashtag_info.user_count,
-                    "formatted_user_count": hashtag_info.formatted_user_count,
-                    "view_count": hashtag_info.view_count,
-                    "formatted_view_count": hashtag_info.formatted_view_count,
-                },
-                "characteristics": {
-                    "is_challenge": hashtag_info.is_challenge,
-                    "is_commerce": hashtag_info.is_commerce,
-                    "is_pgcshow": hashtag_info.is_pgcshow,
-                    "is_strong_music": hashtag_info.is_strong_music,
-                    "type": hashtag_info.type,
-                },
-                "cover": hashtag_info.cover,
-                "raw_data": hashtag_info.dict(),
+                "error": f"Hashtag '{hashtag}' not found or API request failed",
+                "success": False,
+                "hashtag": hashtag,
             }
 
+        return _respond(_format_hashtag_info(hashtag_info, include_raw, compact))
+
     except Exception as e:
         return {
             "error": f"Failed to search TikTok hashtag: {str(e)}",
@@ -63,7 +228,61 @@ async def tiktok_hashtag_search(hashtag: str) -> Dict[str, Any]:
         }
 
 
-async def tiktok_hashtag_posts(challenge_id: str, count: int = 50) -> Dict[str, Any]:
+async def tiktok_hashtags_batch(
+    hashtags: List[str],
+) -> Union[Dict[str, Any], RawJson]:
+    """Search for information on several TikTok hashtags at once.
+
+    Use this instead of repeated tiktok_hashtag_search calls when comparing or
+    researching multiple hashtags. The lookups run concurrently and each result
+    has the same shape as a tiktok_hashtag_search result.
+
+    Args:
+        hashtags: The hashtag names to search for (with or without #)
+    """
+    if not _API_KEY:
+        return dict(_MISSING_KEY_ERROR)
+
+    if not hashtags:
+        return {"error": "hashtags must contain at least one hashtag", "success": False}
+
+    client = _get_client(_API_KEY)
+    infos = await asyncio.gather(
+        *(client.get_hashtag_info(hashtag) for hashtag in hashtags),
+        return_exceptions=True,
+    )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for hashtag, info in zip(hashtags, infos):
+        if isinstance(info, BaseException):
+            results[hashtag] = {
+                "error": f"Failed to search TikTok hashtag: {str(info)}",
+                "success": False,
+                "hashtag": hashtag,
+            }
+        elif not info:
+            results[hashtag] = {
+                "error": f"Hashtag '{hashtag}' not found or API request failed",
+                "success": False,
+                "hashtag": hashtag,
+            }
+        else:
+            results[hashtag] = _format_hashtag_info(info)
+
+    found = sum(1 for result in results.values() if result["success"])
+    return _respond(
+        {
+            "success": found > 0,
+            "found_count": found,
+            "requested_count": len(hashtags),
+            "results": results,
+        }
+    )
+
+
+async def tiktok_hashtag_posts(
+    challenge_id: str, count: int = 50, compact: bool = False, cursor: str = ""
+) -> Union[Dict[str, Any], RawJson]:
     """Get posts/videos from a TikTok hashtag challenge with automatic pagination.
 
     This tool retrieves videos from a specific TikTok hashtag challenge including:
@@ -80,85 +299,64 @@ async def tiktok_hashtag_posts(challenge_id: str, count: int = 50) -> Dict[str,
     Args:
         challenge_id: The hashtag challenge ID (get this from tiktok_hashtag_search first)
         count: Number of videos to fetch (default 50, can be much higher than 20)
+        compact: Return only ids, titles, URLs, durations and raw counts per video
+            to save tokens (default False)
+        cursor: The next_cursor from a previous call for this challenge_id, to
+            continue where it stopped (default starts from the beginning)
     """
-    api_key = os.getenv("RAPIDAPI_KEY")
-    if not api_key:
-        return {"error": "RAPIDAPI_KEY environment variable not set", "success": False}
+    if not _API_KEY:
+        return dict(_MISSING_KEY_ERROR)
+
+    start_cursor = 0
+    if cursor:
+        decoded = OpaqueCursor.decode(cursor)
+        if not decoded or decoded.challenge_id != challenge_id:
+            return {
+                "error": f"Invalid cursor for challenge_id '{challenge_id}'; pass the next_cursor from a previous result for the same challenge",
+                "success": False,
+                "challenge_id": challenge_id,
+            }
+        start_cursor = decoded.offset
 
     try:
         # Ensure reasonable limits but allow much higher counts
         count = max(count, 1)  # At least 1 video
-        max_pages = min(count // 20 + 1, 50)  # Reasonable page limit to prevent abuse
-
-        async with TikTokClient(api_key=api_key) as client:
-            result = await client.get_hashtag_posts(
-                challenge_id=challenge_id, target_count=count, max_pages=max_pages
-            )
-
-            if not result or not result.videos:
-                return {
-                    "error": f"No videos found for challenge_id '{challenge_id}' or API request failed",
-                    "success": False,
-                    "challenge_id": challenge_id,
-                }
-
-            # Format video data for the agent
-            formatted_videos = []
-            for video in result.videos:
-                formatted_video = {
-                    "video_id": video.video_id,
-                    "title": video.title,
-                    "tiktok_url": video.tiktok_url,
-                    "play_url": video.play,
-                    "cover_url": video.cover,
-                    "duration": video.duration,
-                    "author": {
-                        "username": video.author.unique_id
-                        if video.author
-                        else "unknown",
-                        "nickname": video.author.nickname
-                        if video.author
-                        else "unknown",
-                        "avatar": video.author.avatar if video.author else "",
-                    },
-                    "stats": {
-                        "play_count": video.play_count,
-                        "formatted_play_count": video.formatted_play_count,
-                        "like_count": video.digg_count,
-                        "formatted_like_count": video.formatted_digg_count,
-                        "comment_count": video.comment_count,
-                        "formatted_comment_count": video.formatted_comment_count,
-                        "share_count": video.share_count,
-                        "formatted_share_count": video.formatted_share_count,
-                        "collect_count": video.collect_count,
-                    },
-                    "music": {
-                        "title": video.music_info.title if video.music_info else "",
-                        "author": video.music_info.author if video.music_info else "",
-                        "duration": video.music_info.duration
-                        if video.music_info
-                        else 0,
-                        "original": video.music_info.original
-                        if video.music_info
-                        else False,
-                    },
-                    "create_time": video.create_time,
-                    "is_top": bool(video.is_top),
-                }
-                formatted_videos.append(formatted_video)
+        # Reasonable page limit to prevent abuse; pages after the first are
+        # fetched concurrently by the client
+        max_pages = min(count // 20 + 1, 50)
 
+        client = _get_client(_API_KEY)
+        result = await client.get_hashtag_posts(
+            challenge_id=challenge_id,
+            target_count=count,
+            max_pages=max_pages,
+            start_cursor=start_cursor,
+        )
+
+        if not result or not result.videos:
             return {
-                "success": True,
+                "error": f"No videos found for challenge_id '{challenge_id}' or API request failed",
+                "success": False,
                 "challenge_id": challenge_id,
-                "requested_count": count,
-                "video_count": len(formatted_videos),
-                "total_fetched": result.total_fetched,
-                "has_more": result.has_more,
-                "next_cursor": result.cursor,
-                "videos": formatted_videos,
-                "message": f"Successfully fetched {len(formatted_videos)} videos from hashtag challenge (requested: {count})",
             }
 
+        # Format video data for the agent
+        videos = result.videos
+        formatted_videos = [_format_video(video, compact) for video in videos]
+
+        payload = {
+            "success": True,
+            "challenge_id": challenge_id,
+            "requested_count": count,
+            "video_count": len(formatted_videos),
+            "total_fetched": result.total_fetched,
+            "has_more": result.has_more,
+            "next_cursor": result.next_cursor,
+            "videos": formatted_videos,
+            "message": f"Successfully fetched {len(formatted_videos)} videos from hashtag challenge (requested: {count})",
+        }
+        return _respond(payload)
+
     except Exception as e:
         return {
             "error": f"Failed to get hashtag posts: {str(e)}",
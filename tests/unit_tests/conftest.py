@@ -0,0 +1,34 @@
+"""Unit test configuration."""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+_ANALYZER_MODULE = "video_researcher.tools.video_analyzer_tools"
+
+
+def _analyzer_available() -> bool:
+    """Check for the analyzer module without importing the agent package."""
+    spec = importlib.util.find_spec("video_researcher")
+    if spec is None or not spec.submodule_search_locations:
+        return False
+    package_dir = Path(next(iter(spec.submodule_search_locations)))
+    tools_dir = package_dir / "tools"
+    return (tools_dir / "video_analyzer_tools.py").exists() or (
+        tools_dir / "video_analyzer_tools"
+    ).is_dir()
+
+
+# The video analyzer tool module is not part of this tree, but the tools
+# package imports it. Register a stand-in only when it is absent, so tool
+# modules can be imported and tested without it.
+if not _analyzer_available():
+
+    async def video_analyzer(video_url: str) -> str:
+        """Analyze a video (unavailable in this checkout)."""
+        raise NotImplementedError("video_analyzer_tools is not installed")
+
+    _stub = types.ModuleType(_ANALYZER_MODULE)
+    _stub.video_analyzer = video_analyzer  # type: ignore[attr-defined]
+    sys.modules[_ANALYZER_MODULE] = _stub
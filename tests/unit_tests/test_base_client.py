@@ -0,0 +1,85 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from clients.base import AIMDLimiter
+from clients.tiktok import TikTokClient
+from clients.tiktok.endpoints import ENDPOINTS
+
+
+class MockTransportClient(TikTokClient):
+    """TikTok client answering requests with a fixed sequence of status codes."""
+
+    def __init__(self, status_codes: List[int]):
+        super().__init__(api_key="test-key")
+        self.status_codes = status_codes
+        self.backoff_base = 0.0
+        self.requests = 0
+
+    def _create_transport(self) -> httpx.AsyncBaseTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            status_code = self.status_codes[
+                min(self.requests, len(self.status_codes) - 1)
+            ]
+            self.requests += 1
+            return httpx.Response(status_code, headers={"Retry-After": "0"}, json={})
+
+        return httpx.MockTransport(handler)
+
+
+def test_client_is_reused_within_a_loop() -> None:
+    client = TikTokClient(api_key="test-key")
+
+    async def get_twice() -> bool:
+        return client.client is client.client
+
+    assert asyncio.run(get_twice())
+    asyncio.run(client.close())
+
+
+def test_client_is_not_shared_across_loops() -> None:
+    client = TikTokClient(api_key="test-key")
+
+    async def get_client() -> object:
+        return client.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    asyncio.run(client.close())
+    assert client._clients == {}
+
+
+def test_send_retries_throttled_responses() -> None:
+    client = MockTransportClient([429, 503, 200])
+
+    response = asyncio.run(client._send("GET", ENDPOINTS["CHALLENGE_INFO"]))
+
+    assert response.status_code == 200
+    assert client.requests == 3
+
+
+def test_send_gives_up_after_max_retries() -> None:
+    client = MockTransportClient([429])
+
+    response = asyncio.run(client._send("GET", ENDPOINTS["CHALLENGE_INFO"]))
+
+    assert response.status_code == 429
+    assert client.requests == client.max_retries + 1
+
+
+def test_aimd_limiter_adjusts_limit() -> None:
+    limiter = AIMDLimiter(max_limit=8)
+
+    limiter.on_failure()
+    assert limiter.limit == 4
+    limiter.on_success()
+    assert 4 < limiter.limit < 5
+
+
+def test_aimd_limiter_rejects_limit_below_one() -> None:
+    with pytest.raises(ValueError):
+        AIMDLimiter(max_limit=0)
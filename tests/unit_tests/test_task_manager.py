@@ -0,0 +1,41 @@
+from typing import Any, Dict
+
+from common.task_management import Task, TaskManager, TaskStatus
+
+
+def test_update_tasks_in_state_adds_and_updates() -> None:
+    state: Dict[str, Any] = {"tasks": [Task(id="a", content="Research #cats")]}
+
+    result = TaskManager.update_tasks_in_state(
+        state,
+        [
+            {"id": "a", "content": "Research #cats", "status": "completed"},
+            {"id": "a", "content": "Research #cats", "status": "completed"},
+            {"content": "Compare engagement", "priority": "high"},
+        ],
+    )
+
+    assert result["success"]
+    assert result["stats"] == {"added": 1, "updated": 1, "unchanged": 1}
+    assert result["summary"]["completed"] == 2
+    assert result["summary"]["pending"] == 1
+    assert state["tasks"][0].status is TaskStatus.COMPLETED
+    assert result["task_ids"][0] == "a"
+    assert TaskManager.render_tasks(state["tasks"])[0]["status"] == "completed"
+
+
+def test_get_tasks_summary_empty_state() -> None:
+    result = TaskManager.get_tasks_summary({})
+
+    assert result["success"]
+    assert result["total_tasks"] == 0
+
+
+def test_task_formatted_timestamps_follow_updates() -> None:
+    task = Task(content="Research #cats", created_at=0, updated_at=0)
+    initial = task.formatted_updated_at
+
+    task.mark_completed()
+
+    assert task.formatted_created_at == initial
+    assert task.formatted_updated_at != initial
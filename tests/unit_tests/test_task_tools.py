@@ -0,0 +1,15 @@
+from typing import Any, Dict
+
+from video_researcher.tools.task_tools import task_manager
+
+
+def test_task_manager_rejects_unhashable_status_and_priority() -> None:
+    state: Dict[str, Any] = {}
+
+    bad_status = task_manager(state, [{"content": "x", "status": ["pending"]}])
+    bad_priority = task_manager(state, [{"content": "x", "priority": {"high": 1}}])
+
+    assert bad_status["success"] is False
+    assert "invalid status" in bad_status["error"]
+    assert bad_priority["success"] is False
+    assert "invalid priority" in bad_priority["error"]
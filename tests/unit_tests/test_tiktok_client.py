@@ -0,0 +1,316 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from clients.tiktok import TikTokClient
+from clients.tiktok.models import (
+    HashtagInfo,
+    OpaqueCursor,
+    PaginatedResult,
+    VideoInfo,
+)
+
+
+def _video(index: int) -> VideoInfo:
+    return VideoInfo(aweme_id=str(index), video_id=str(index))
+
+
+class FakePagesClient(TikTokClient):
+    """TikTok client serving pages from an in-memory list of videos."""
+
+    def __init__(
+        self,
+        total: int,
+        reject_cursors: Tuple[int, ...] = (),
+        overlap: int = 0,
+        short_pages: Optional[Dict[int, int]] = None,
+    ):
+        super().__init__(api_key="test-key")
+        self.total = total
+        self.reject_cursors = reject_cursors
+        self.overlap = overlap
+        self.short_pages = short_pages or {}
+        self.calls: List[Tuple[int, int]] = []
+
+    async def get_hashtag_posts_page(
+        self, challenge_id: str, count: int = 20, cursor: int = 0
+    ) -> Optional[PaginatedResult]:
+        self.calls.append((cursor, count))
+        await asyncio.sleep(0)
+        if cursor in self.reject_cursors:
+            return None
+        end = min(cursor + self.short_pages.get(cursor, count), self.total)
+        return PaginatedResult(
+            videos=[_video(i) for i in range(max(cursor - self.overlap, 0), end)],
+            cursor=end,
+            has_more=end < self.total,
+            total_fetched=end - cursor,
+        )
+
+
+class FakeResponseClient(TikTokClient):
+    """TikTok client returning a canned JSON body for every request."""
+
+    def __init__(self, body: Dict[str, Any], status_code: int = 200):
+        super().__init__(api_key="test-key")
+        self.body = body
+        self.status_code = status_code
+        self.sent = 0
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        self.sent += 1
+        await asyncio.sleep(0)
+        return httpx.Response(self.status_code, content=json.dumps(self.body))
+
+
+def test_get_hashtag_info_parses_response() -> None:
+    client = FakeResponseClient(
+        {
+            "code": 0,
+            "msg": "success",
+            "processed_time": 0.1,
+            "data": {"id": "42", "cha_name": "cats", "view_count": 1500},
+        }
+    )
+
+    info = asyncio.run(client.get_hashtag_info("#cats"))
+
+    assert info is not None
+    assert info.id == "42"
+    assert info.formatted_view_count == "1.5K views"
+
+
+def test_get_hashtag_info_is_cached() -> None:
+    client = FakeResponseClient(
+        {
+            "code": 0,
+            "msg": "success",
+            "processed_time": 0.1,
+            "data": {"id": "42", "cha_name": "cats"},
+        }
+    )
+
+    async def lookup() -> None:
+        await asyncio.gather(*(client.get_hashtag_info("cats") for _ in range(3)))
+        await client.get_hashtag_info("#cats")
+
+    asyncio.run(lookup())
+
+    assert client.sent == 1
+
+
+def test_concurrent_failed_lookups_share_one_request() -> None:
+    client = FakeResponseClient(
+        {"code": -1, "msg": "not found", "processed_time": 0.1, "data": {}}
+    )
+
+    async def lookup() -> List[Optional[HashtagInfo]]:
+        return list(
+            await asyncio.gather(
+                *(client.get_hashtag_info("missing") for _ in range(3))
+            )
+        )
+
+    assert asyncio.run(lookup()) == [None, None, None]
+    assert client.sent == 1
+
+
+def test_get_hashtag_info_returns_none_on_api_error() -> None:
+    client = FakeResponseClient(
+        {"code": -1, "msg": "not found", "processed_time": 0.1, "data": {}}
+    )
+
+    assert asyncio.run(client.get_hashtag_info("missing")) is None
+
+
+def test_get_hashtag_posts_fetches_predicted_pages() -> None:
+    client = FakePagesClient(total=200)
+
+    result = asyncio.run(client.get_hashtag_posts("123", target_count=50))
+
+    assert result is not None
+    assert [v.aweme_id for v in result.videos] == [str(i) for i in range(50)]
+    assert result.cursor == 50
+    assert client.calls == [(0, 20), (20, 20), (40, 10)]
+
+
+def test_get_hashtag_posts_falls_back_when_prediction_rejected() -> None:
+    client = FakePagesClient(total=200, reject_cursors=(20,))
+
+    result = asyncio.run(client.get_hashtag_posts("123", target_count=45))
+
+    assert result is not None
+    assert result.total_fetched == 20
+    assert client.calls[:3] == [(0, 20), (20, 20), (40, 5)]
+
+
+def test_get_hashtag_posts_resumes_after_short_predicted_page() -> None:
+    client = FakePagesClient(total=200, short_pages={20: 15})
+
+    result = asyncio.run(client.get_hashtag_posts("123", target_count=60))
+
+    assert result is not None
+    assert [v.aweme_id for v in result.videos] == [str(i) for i in range(60)]
+    assert client.calls[3:] == [(35, 20), (55, 5)]
+
+
+def test_get_hashtag_posts_drops_repeated_videos() -> None:
+    client = FakePagesClient(total=200, overlap=5)
+
+    result = asyncio.run(client.get_hashtag_posts("123", target_count=50))
+
+    assert result is not None
+    ids = [v.aweme_id for v in result.videos]
+    assert len(ids) == len(set(ids)) == 50
+
+
+def test_get_hashtag_posts_stops_when_exhausted() -> None:
+    client = FakePagesClient(total=30)
+
+    result = asyncio.run(client.get_hashtag_posts("123", target_count=100))
+
+    assert result is not None
+    assert result.total_fetched == 30
+
+
+def test_iter_hashtag_posts_fetches_lazily() -> None:
+    client = FakePagesClient(total=200)
+
+    async def first_25() -> List[str]:
+        ids = []
+        async for video in client.iter_hashtag_posts("123"):
+            ids.append(video.aweme_id)
+            if len(ids) == 25:
+                break
+        return ids
+
+    assert asyncio.run(first_25()) == [str(i) for i in range(25)]
+    assert client.calls == [(0, 20), (20, 20)]
+
+
+def test_rate_limit_delay_when_quota_nearly_exhausted() -> None:
+    client = TikTokClient(api_key="test-key", rate_limit_threshold=5)
+
+    exhausted = httpx.Response(
+        200,
+        headers={
+            "X-RateLimit-Requests-Remaining": "2",
+            "X-RateLimit-Requests-Reset": "3",
+        },
+    )
+    plenty = httpx.Response(200, headers={"X-RateLimit-Requests-Remaining": "90"})
+
+    assert client._rate_limit_delay(exhausted) == 3
+    assert client._rate_limit_delay(plenty) == 0
+
+
+def test_opaque_cursor_round_trips() -> None:
+    token = OpaqueCursor(challenge_id="123", offset=40).encode()
+
+    cursor = OpaqueCursor.decode(token)
+
+    assert cursor is not None
+    assert (cursor.challenge_id, cursor.offset) == ("123", 40)
+    assert OpaqueCursor.decode("not-a-token") is None
+
+
+def test_get_hashtag_posts_by_token_resumes_at_offset() -> None:
+    client = FakePagesClient(total=200)
+    token = OpaqueCursor(challenge_id="123", offset=40).encode()
+
+    result = asyncio.run(client.get_hashtag_posts_by_token(token))
+
+    assert result is not None
+    assert client.calls == [(40, 20)]
+
+
+def test_get_hashtag_info_cache_ignores_case() -> None:
+    client = FakeResponseClient(
+        {
+            "code": 0,
+            "msg": "success",
+            "processed_time": 0.1,
+            "data": {"id": "42", "cha_name": "cats"},
+        }
+    )
+
+    async def lookup() -> None:
+        await client.get_hashtag_info("#Cats")
+        await client.get_hashtag_info("cats")
+
+    asyncio.run(lookup())
+
+    assert client.sent == 1
+
+
+def test_concurrent_identical_posts_requests_share_one_request() -> None:
+    client = FakeResponseClient(
+        {
+            "code": 0,
+            "msg": "success",
+            "processed_time": 0.1,
+            "data": {
+                "videos": [{"aweme_id": "1", "video_id": "1"}],
+                "cursor": 1,
+                "hasMore": False,
+            },
+        }
+    )
+
+    async def fetch() -> None:
+        await asyncio.gather(
+            *(client.get_hashtag_posts("123", target_count=10) for _ in range(3))
+        )
+
+    asyncio.run(fetch())
+
+    assert client.sent == 1
+
+
+def test_get_hashtag_posts_resumes_from_start_cursor() -> None:
+    client = FakePagesClient(total=200)
+
+    first = asyncio.run(client.get_hashtag_posts("123", target_count=40))
+    assert first is not None
+    cursor = OpaqueCursor.decode(first.next_cursor)
+    assert cursor is not None
+
+    result = asyncio.run(
+        client.get_hashtag_posts("123", target_count=30, start_cursor=cursor.offset)
+    )
+
+    assert result is not None
+    assert [v.aweme_id for v in result.videos] == [str(i) for i in range(40, 70)]
+    assert client.calls[-2:] == [(40, 20), (60, 10)]
+
+
+def test_get_hashtag_posts_bounds_predictions_for_short_feed() -> None:
+    client = FakePagesClient(total=60)
+
+    result = asyncio.run(
+        client.get_hashtag_posts("123", target_count=1000, max_pages=50)
+    )
+
+    assert result is not None
+    assert result.total_fetched == 60
+    # The first page plus one window of max_concurrency predictions
+    assert len(client.calls) == 1 + client._limiter.max_limit
+
+
+def test_get_hashtag_posts_has_more_matches_next_cursor() -> None:
+    client = FakePagesClient(total=40)
+
+    exhausted = asyncio.run(client.get_hashtag_posts("123", target_count=40))
+    partial = asyncio.run(client.get_hashtag_posts("123", target_count=20))
+
+    assert exhausted is not None and partial is not None
+    assert (exhausted.has_more, exhausted.next_cursor) == (False, "")
+    assert partial.has_more and partial.next_cursor
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from clients.tiktok import HashtagInfo, TikTokClient
+from video_researcher.tools import tiktok_tools
+
+
+class FakeInfoClient(TikTokClient):
+    """TikTok client answering hashtag lookups without network access."""
+
+    def __init__(self) -> None:
+        super().__init__(api_key="test-key")
+
+    async def get_hashtag_info(self, hashtag_name: str) -> Optional[HashtagInfo]:
+        await asyncio.sleep(0)
+        if hashtag_name == "broken":
+            raise RuntimeError("boom")
+        if hashtag_name == "missing":
+            return None
+        return HashtagInfo(id="42", cha_name=hashtag_name)
+
+
+@pytest.fixture
+def fake_client(monkeypatch: pytest.MonkeyPatch) -> FakeInfoClient:
+    client = FakeInfoClient()
+    monkeypatch.setattr(tiktok_tools, "_API_KEY", "test-key")
+    monkeypatch.setattr(tiktok_tools, "RAW_JSON", False)
+    monkeypatch.setattr(tiktok_tools, "_get_client", lambda api_key: client)
+    return client
+
+
+def test_hashtags_batch_maps_each_outcome(fake_client: FakeInfoClient) -> None:
+    result = asyncio.run(
+        tiktok_tools.tiktok_hashtags_batch(["cats", "missing", "broken"])
+    )
+
+    assert result["success"] is True
+    assert result["found_count"] == 1
+    results = result["results"]
+    assert results["cats"]["challenge_id"] == "42"
+    assert results["missing"]["success"] is False
+    assert "not found" in results["missing"]["error"]
+    assert results["broken"]["success"] is False
+    assert "boom" in results["broken"]["error"]
+
+
+def test_hashtags_batch_rejects_empty_list(fake_client: FakeInfoClient) -> None:
+    result = asyncio.run(tiktok_tools.tiktok_hashtags_batch([]))
+
+    assert result["success"] is False
+    assert "error" in result
+
+
+@pytest.mark.parametrize("value", ["10m", "0", "-5", "nan"])
+def test_number_from_env_falls_back_on_invalid_values(
+    monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    monkeypatch.setenv("TIKTOK_HASHTAG_TTL", value)
+
+    with pytest.warns(UserWarning):
+        ttl = tiktok_tools._number_from_env("TIKTOK_HASHTAG_TTL", 600.0, float)
+
+    assert ttl == 600.0